@@ -1,15 +1,23 @@
 """Prometheus Metrics Exporter"""
 
-import threading
-from typing import Any, Optional
-from prometheus_client import Counter, Gauge, Histogram, Summary, start_http_server
+import sys
+from typing import Any, Callable, Optional
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    Summary,
+    start_http_server,
+)
 from bindl.logger import setup_logger
 
 
 LOG = setup_logger(__name__)
 
 
-class MetricsExporter:
+class MetricsExporter:  # pylint: disable=too-many-instance-attributes
     """
     Generic class for registering and exposing Prometheus metrics.
 
@@ -20,39 +28,145 @@ class MetricsExporter:
     - Summary: captures quantiles (e.g., latency)
 
     Automatically starts an HTTP server to expose metrics at /metrics.
+
+    Metric names are interned when registered, so the lookups done with the
+    (compiler-interned) literal names used at call sites compare by identity.
+
+    Every `register_*` method returns a function bound to the new metric.
+    Calling it skips the name lookup done by `inc_counter()`, `set_gauge()`,
+    `observe_histogram()` and `observe_summary()`, so prefer it on hot paths.
     """
 
-    def __init__(self, port: Optional[int] = None, addr: Optional[str] = None):
+    __slots__ = (
+        "port",
+        "addr",
+        "_registry",
+        "_http_server",
+        "counters",
+        "gauges",
+        "histograms",
+        "summaries",
+        "_child_cache",
+    )
+
+    def __init__(
+        self,
+        port: Optional[int] = None,
+        addr: Optional[str] = None,
+        registry: CollectorRegistry = REGISTRY,
+    ):
         """
         Starts the Prometheus metrics HTTP server.
 
         ** Attributes **
             port: Port where the /metrics endpoint will be exposed.
             addr: Address to bind the HTTP server to. Default is "0.0.0.0".
+            registry: Registry the metrics are registered in and exposed from.
+                Default is the prometheus_client global registry.
 
         If 'port' and 'addr' is not defined, MetricsExporter class does not
         starts http server.
+
+        Metrics are updated in-process. The prometheus_client multiprocess
+        mode, which writes every update to a memory-mapped file, is only
+        enabled when PROMETHEUS_MULTIPROC_DIR is set before it is imported;
+        leave that variable unset unless several worker processes must share
+        their metrics.
         """
+        self._registry = registry
+        self._http_server: Optional[tuple[Any, Any]] = None
         if port and addr:
             self.port = port
             self.addr = addr
-            self._start_http_server()
+            # start_http_server already serves from its own daemon thread
+            self._http_server = start_http_server(
+                self.port, addr=self.addr, registry=self._registry
+            )
 
         self.counters: dict[str, Any] = {}
         self.gauges: dict[str, Any] = {}
         self.histograms: dict[str, Any] = {}
         self.summaries: dict[str, Any] = {}
+        # Resolved labelled child per (kind, name, label items)
+        self._child_cache: dict[tuple[str, str, tuple], Any] = {}
 
-    def _start_http_server(self):
-        thread = threading.Thread(
-            target=start_http_server, args=(self.port,), kwargs={"addr": self.addr}
-        )
-        thread.daemon = True
-        thread.start()
+    def stop_http_server(self) -> None:
+        """
+        Stops the HTTP server started by the constructor, if any.
+        """
+        if self._http_server is None:
+            return
+        server, thread = self._http_server
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        self._http_server = None
+
+    def _resolve(
+        self,
+        kind: str,
+        store: dict[str, Any],
+        name: str,
+        labels: dict[str, str],
+    ) -> Any:
+        """
+        Returns the labelled child of a metric to update.
+
+        The result is cached, so repeated updates of the same metric and labels
+        skip the registry lookup and the `labels()` call. Unlabelled updates do
+        not go through this cache: they are a single registry lookup already.
+
+        ** Attributes **
+            kind: Metric type name, part of the cache key.
+            store: Registered metrics of that type.
+            name: Metric name.
+            labels: Labels to apply.
+
+        ** Returns **
+            The labelled child, or None if the metric is not registered.
+        """
+        key = (kind, name, tuple(labels.items()))
+        child = self._child_cache.get(key)
+        if child is None:
+            metric = store.get(name)
+            if metric is None:
+                return None
+            child = metric.labels(**labels)
+            self._child_cache[key] = child
+        return child
+
+    @staticmethod
+    def _bind(metric: Any, action: str) -> Callable[..., None]:
+        """
+        Builds a function that updates the given metric directly.
+
+        ** Attributes **
+            metric: The registered Prometheus metric.
+            action: Name of the update method ("inc", "set" or "observe").
+
+        ** Returns **
+            A function taking the value and optional labels, that caches the
+            labelled children it resolves.
+        """
+        update = getattr(metric, action)
+        children: dict[tuple, Callable[[float], None]] = {}
+
+        def bound(value: float, labels: Optional[dict[str, str]] = None) -> None:
+            if not labels:
+                update(value)
+                return
+            key = tuple(labels.items())
+            child_update = children.get(key)
+            if child_update is None:
+                child_update = getattr(metric.labels(**labels), action)
+                children[key] = child_update
+            child_update(value)
+
+        return bound
 
     def register_counter(
         self, name: str, description: str, label_names: Optional[list[Any]] = None
-    ):
+    ) -> Callable[..., None]:
         """
         Registers a Counter metric.
 
@@ -60,9 +174,16 @@ class MetricsExporter:
             name: Metric name.
             description: Metric description.
             label_names: Optional list of label names.
+
+        ** Returns **
+            A function `inc(value, labels=None)` bound to the counter.
         """
+        name = sys.intern(name)
         label_names = label_names or []
-        self.counters[name] = Counter(name, description, label_names)
+        self.counters[name] = Counter(
+            name, description, label_names, registry=self._registry
+        )
+        return self._bind(self.counters[name], "inc")
 
     def inc_counter(
         self, name: str, labels: Optional[dict[str, str]] = None, value: float = 1
@@ -75,18 +196,19 @@ class MetricsExporter:
             labels: Optional labels to apply.
             value: Increment value (default is 1).
         """
-        metric = self.counters.get(name)
+        metric = (
+            self._resolve("Counter", self.counters, name, labels)
+            if labels
+            else self.counters.get(name)
+        )
         if metric is None:
             LOG.warning("Counter %r is not registered.", name)
             return
-        if labels:
-            metric.labels(**labels).inc(value)
-        else:
-            metric.inc(value)
+        metric.inc(value)
 
     def register_gauge(
         self, name: str, description: str, label_names: Optional[list[Any]] = None
-    ):
+    ) -> Callable[..., None]:
         """
         Registers a Prometheus Gauge metric.
 
@@ -101,15 +223,23 @@ class MetricsExporter:
             label_names: List of label names (keys) that will be used
                 when setting the gauge.
 
+        ** Returns **
+            A function `set(value, labels=None)` bound to the gauge.
+
         Example:
-            exporter.register_gauge(
+            set_cpu_temperature = exporter.register_gauge(
                 name="cpu_temperature_celsius",
                 description="Current temperature of the CPU in Celsius",
                 label_names=["core"]
             )
+            set_cpu_temperature(68.5, {"core": "core_0"})
         """
+        name = sys.intern(name)
         label_names = label_names or []
-        self.gauges[name] = Gauge(name, description, label_names)
+        self.gauges[name] = Gauge(
+            name, description, label_names, registry=self._registry
+        )
+        return self._bind(self.gauges[name], "set")
 
     def set_gauge(
         self, name: str, value: float, labels: Optional[dict[str, str]] = None
@@ -139,14 +269,15 @@ class MetricsExporter:
                 labels={"core": "core_0"}
             )
         """
-        metric = self.gauges.get(name)
+        metric = (
+            self._resolve("Gauge", self.gauges, name, labels)
+            if labels
+            else self.gauges.get(name)
+        )
         if metric is None:
             LOG.warning("Gauge %r is not registered.", name)
             return
-        if labels:
-            metric.labels(**labels).set(value)
-        else:
-            metric.set(value)
+        metric.set(value)
 
     def register_histogram(
         self,
@@ -154,7 +285,7 @@ class MetricsExporter:
         description: str,
         label_names: Optional[list[str]] = None,
         buckets: Optional[list[float]] = None,
-    ):
+    ) -> Callable[..., None]:
         """
         Registers a Prometheus Histogram metric.
 
@@ -170,6 +301,9 @@ class MetricsExporter:
             label_names: List of label keys (default is []).
             buckets: Custom bucket upper bounds (default: Prometheus default buckets).
 
+        ** Returns **
+            A function `observe(value, labels=None)` bound to the histogram.
+
         ** Example Usage **
             exporter.register_histogram(
                 name="job_duration_seconds",
@@ -178,15 +312,23 @@ class MetricsExporter:
                 buckets=[0.1, 0.5, 1, 2, 5, 10]
             )
         """
+        name = sys.intern(name)
         if label_names is None:
             label_names = []
 
         if buckets is not None:
             self.histograms[name] = Histogram(
-                name, description, labelnames=label_names, buckets=buckets
+                name,
+                description,
+                labelnames=label_names,
+                buckets=buckets,
+                registry=self._registry,
             )
         else:
-            self.histograms[name] = Histogram(name, description, labelnames=label_names)
+            self.histograms[name] = Histogram(
+                name, description, labelnames=label_names, registry=self._registry
+            )
+        return self._bind(self.histograms[name], "observe")
 
     def observe_histogram(
         self, name: str, value: float, labels: Optional[dict[str, str]] = None
@@ -212,18 +354,19 @@ class MetricsExporter:
                 labels={"job_type": "data_backup"}
             )
         """
-        metric = self.histograms.get(name)
+        metric = (
+            self._resolve("Histogram", self.histograms, name, labels)
+            if labels
+            else self.histograms.get(name)
+        )
         if metric is None:
             LOG.warning("Histogram %r is not registered.", name)
             return
-        if labels:
-            metric.labels(**labels).observe(value)
-        else:
-            metric.observe(value)
+        metric.observe(value)
 
     def register_summary(
         self, name: str, description: str, label_names: Optional[list[Any]] = None
-    ):
+    ) -> Callable[..., None]:
         """
         Registers a Prometheus Summary metric.
 
@@ -238,6 +381,9 @@ class MetricsExporter:
             description: Description of what the metric measures.
             label_names: List of label keys to categorize metrics (default is []).
 
+        ** Returns **
+            A function `observe(value, labels=None)` bound to the summary.
+
         ** Example Usage **
             exporter.register_summary(
                 name="request_duration_seconds",
@@ -245,8 +391,12 @@ class MetricsExporter:
                 label_names=["method", "endpoint"]
             )
         """
+        name = sys.intern(name)
         label_names = label_names or []
-        self.summaries[name] = Summary(name, description, label_names)
+        self.summaries[name] = Summary(
+            name, description, label_names, registry=self._registry
+        )
+        return self._bind(self.summaries[name], "observe")
 
     def observe_summary(
         self, name: str, value: float, labels: Optional[dict[str, str]] = None
@@ -272,11 +422,12 @@ class MetricsExporter:
                 labels={"method": "GET", "endpoint": "/users"}
             )
         """
-        metric = self.summaries.get(name)
+        metric = (
+            self._resolve("Summary", self.summaries, name, labels)
+            if labels
+            else self.summaries.get(name)
+        )
         if metric is None:
             LOG.warning("Summary %r is not registered.", name)
             return
-        if labels:
-            metric.labels(**labels).observe(value)
-        else:
-            metric.observe(value)
+        metric.observe(value)
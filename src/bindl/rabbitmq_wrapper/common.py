@@ -1,7 +1,8 @@
 """RabbitMQ Base Class for Publisher and Consumer"""
 
 import os
-from typing import Optional
+import threading
+from typing import ClassVar, Optional
 
 import pika
 
@@ -11,8 +12,15 @@ class RabbitMQBase:  # pylint: disable=too-few-public-methods
     Base class for RabbitMQ Publisher and Consumer.
     This class provides common connection and channel creation methods.
     It is not intended to be used directly.
+
+    Publishers and consumers created by the same thread for the same broker
+    and user share a single `BlockingConnection` and open their own
+    lightweight channel on it. Each thread gets its own connection, since a
+    `BlockingConnection` must not be used from several threads.
     """
 
+    _local: ClassVar[threading.local] = threading.local()
+
     def __init__(self, **kwargs: Optional[str]) -> None:
         """
         Initializes the RabbitMQ base class with connection parameters.
@@ -26,7 +34,13 @@ class RabbitMQBase:  # pylint: disable=too-few-public-methods
         self.__username = kwargs.get("username") or os.getenv("RABBITMQ_USER")
         self.__password = kwargs.get("password") or os.getenv("RABBITMQ_PASS")
 
-    def _get_connection_params(self) -> pika.BlockingConnection:
+    def _get_connection_params(self) -> pika.ConnectionParameters:
+        """
+        Builds the connection parameters of the broker.
+
+        **Returns:**
+            A ConnectionParameters object, to be built once and stored by the caller.
+        """
         connection_parameters = pika.ConnectionParameters(
             host=self.__host,
             port=self.__port,
@@ -35,3 +49,53 @@ class RabbitMQBase:  # pylint: disable=too-few-public-methods
             ),
         )
         return connection_parameters
+
+    @classmethod
+    def shared_connection(
+        cls, parameters: pika.ConnectionParameters
+    ) -> pika.BlockingConnection:
+        """
+        Returns the connection shared by the publishers and consumers of a broker
+        created by the calling thread.
+
+        The connection is created on first use and recreated if it was closed.
+
+        **Parameters:**
+            parameters: The connection parameters of the broker.
+
+        **Returns:**
+            An open BlockingConnection.
+        """
+        key = (
+            parameters.host,
+            parameters.port,
+            parameters.virtual_host,
+            parameters.credentials.username,
+        )
+        connections = cls.__thread_connections()
+        connection = connections.get(key)
+        if connection is None or connection.is_closed:
+            connection = pika.BlockingConnection(parameters)
+            connections[key] = connection
+        return connection
+
+    @classmethod
+    def close_shared_connections(cls) -> None:
+        """
+        Closes every shared connection of the calling thread still open.
+        """
+        connections = cls.__thread_connections()
+        for connection in connections.values():
+            if connection.is_open:
+                connection.close()
+        connections.clear()
+
+    @classmethod
+    def __thread_connections(cls) -> dict[tuple, pika.BlockingConnection]:
+        """
+        Returns the shared connections of the calling thread, keyed by broker and user.
+        """
+        connections = getattr(cls._local, "connections", None)
+        if connections is None:
+            connections = cls._local.connections = {}
+        return connections
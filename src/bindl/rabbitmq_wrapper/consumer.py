@@ -7,12 +7,18 @@ from typing import Any, Callable, Optional
 
 import pika
 
+import bindl.logger
 import bindl.rabbitmq_wrapper.common
 
+LOG = bindl.logger.setup_logger(__name__)
+
+# Maximum delay, in seconds, before processed messages are acknowledged
+ACK_FLUSH_INTERVAL: float = 1.0
+
 
 class RabbitmqConsumer(
     bindl.rabbitmq_wrapper.common.RabbitMQBase
-):  # pylint: disable=too-few-public-methods
+):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     A RabbitMQ consumer class for consuming messages from a specified queue.
     This class uses the pika library to handle the connection and message consumption.
@@ -22,14 +28,26 @@ class RabbitmqConsumer(
         self,
         queue: str,
         callback: Callable[..., Any],
+        prefetch_count: int = 100,
         **kwargs: Optional[str],
     ) -> None:
         """
         Initializes a RabbitMQ consumer.
 
+        Messages are acknowledged once the callback returns, in batches of
+        half the prefetch window (or after `ACK_FLUSH_INTERVAL` seconds), so
+        the broker keeps delivering while acknowledgements are in flight.
+        A message whose callback raises is not acknowledged and is redelivered.
+        The callback must not settle messages itself (`basic_ack`, `basic_nack`
+        or `basic_reject` on the channel it receives): the batched
+        `basic_ack(multiple=True)` would cover an already settled delivery tag
+        and the broker would close the channel with PRECONDITION_FAILED.
+
         **Parameters:**
             callback: The function to be called when a message is received.
             queue: The name of the RabbitMQ queue to consume messages from.
+            prefetch_count: Maximum number of unacknowledged messages delivered
+                to this consumer. Defaults to 100.
             host: The hostname of the RabbitMQ server. Defaults to "localhost".
             port: The port number of the RabbitMQ server. Defaults to 5672.
         """
@@ -37,29 +55,37 @@ class RabbitmqConsumer(
         super().__init__(**kwargs)
         self.__queue = queue
         self.__callback = callback
+        self.__prefetch_count = max(1, prefetch_count)
+        self.__ack_batch_size = max(1, self.__prefetch_count // 2)
+        self.__unacked = 0
+        self.__last_delivery_tag = 0
+        self.__ack_flush_scheduled = False
         self.__connection_parameters = self._get_connection_params()
         self.__connection = self.__create_connection()
         self.__channel = self.__create_channel(self.__connection)
 
     def __create_connection(self) -> pika.BlockingConnection:
         """
-        Creates a connection to RabbitMQ.
+        Retrieves the connection to RabbitMQ shared with the other consumers
+        and publishers of the same broker.
 
         **Returns:**
             A connection object to RabbitMQ.
         """
         try:
-            return pika.BlockingConnection(self.__connection_parameters)
+            return self.shared_connection(self.__connection_parameters)
         except pika.exceptions.AMQPConnectionError as e:
-            print(f"Failed to connect to RabbitMQ: {e}")
+            LOG.error("Failed to connect to RabbitMQ: %s", e)
             raise
         except Exception as e:
-            print(f"An unexpected error occurred while creating the connection: {e}")
+            LOG.error(
+                "An unexpected error occurred while creating the connection: %s", e
+            )
             raise
 
     def __create_channel(
         self, connection: pika.BlockingConnection
-    ) -> pika.BlockingConnection.channel:
+    ) -> pika.adapters.blocking_connection.BlockingChannel:
         """
         Creates a channel for consuming messages from RabbitMQ.
 
@@ -72,34 +98,75 @@ class RabbitmqConsumer(
         try:
             channel = connection.channel()
             channel.queue_declare(queue=self.__queue, durable=True)
-            channel.basic_qos(prefetch_count=1)  # Ensures fair dispatch of messages
+            channel.basic_qos(prefetch_count=self.__prefetch_count)
             channel.basic_consume(
-                queue=self.__queue, auto_ack=True, on_message_callback=self.__callback
+                queue=self.__queue,
+                auto_ack=False,
+                on_message_callback=self.__on_message,
             )
             return channel
         except pika.exceptions.ChannelError as e:
-            print(f"Failed to create a channel: {e}")
+            LOG.error("Failed to create a channel: %s", e)
             raise
         except Exception as e:
-            print(f"An unexpected error occurred while creating the channel: {e}")
+            LOG.error("An unexpected error occurred while creating the channel: %s", e)
             raise
 
+    def __on_message(
+        self,
+        channel: pika.adapters.blocking_connection.BlockingChannel,
+        method: pika.spec.Basic.Deliver,
+        properties: pika.spec.BasicProperties,
+        body: bytes,
+    ) -> None:
+        """
+        Runs the user callback and records the message for a batched acknowledgement.
+        """
+        self.__callback(channel, method, properties, body)
+        self.__last_delivery_tag = method.delivery_tag
+        self.__unacked += 1
+        if self.__unacked >= self.__ack_batch_size:
+            self.__flush_acks()
+        elif not self.__ack_flush_scheduled:
+            self.__ack_flush_scheduled = True
+            self.__connection.call_later(ACK_FLUSH_INTERVAL, self.__on_ack_timer)
+
+    def __on_ack_timer(self) -> None:
+        """
+        Acknowledges the messages left pending when the flush interval expires.
+        """
+        self.__ack_flush_scheduled = False
+        self.__flush_acks()
+
+    def __flush_acks(self) -> None:
+        """
+        Acknowledges every processed message with a single `basic_ack(multiple=True)`.
+        """
+        if self.__unacked and self.__channel.is_open:
+            self.__channel.basic_ack(
+                delivery_tag=self.__last_delivery_tag, multiple=True
+            )
+            self.__unacked = 0
+
     def start(self) -> None:
         """
         Starts consuming messages from the RabbitMQ queue.
         This method will block and listen for incoming messages.
         """
         try:
-            print(f"Listening to RabbitMQ queue: {self.__queue}")
-            print("Waiting for messages...")
+            LOG.info("Listening to RabbitMQ queue: %s", self.__queue)
+            LOG.info("Waiting for messages...")
             self.__channel.start_consuming()
         except KeyboardInterrupt:
-            print("\nConsumption interrupted by user. Closing connection...")
+            LOG.info("Consumption interrupted by user. Closing channel...")
         except Exception as e:  # pylint: disable=broad-except
-            print(f"An error occurred while consuming messages: {e}")
+            LOG.error("An error occurred while consuming messages: %s", e)
         finally:
+            try:
+                self.__flush_acks()
+            except pika.exceptions.AMQPError as e:
+                LOG.error("Failed to acknowledge processed messages: %s", e)
+            # The connection is shared, only this consumer's channel is closed
             if self.__channel.is_open:
                 self.__channel.close()
-            if self.__connection.is_open:
-                self.__connection.close()
-            print("Connection closed.")
+            LOG.info("Channel closed.")
@@ -5,25 +5,55 @@ sending messages to a specified exchange and routing key.
 """
 
 import json
-from typing import Dict, Optional
+import time
+from typing import ClassVar, Dict, Iterable, Optional
 
+import orjson
 import pika
 
 import bindl.rabbitmq_wrapper.common
 
+# Default number of messages written to the socket in a single flush by send_batch()
+DEFAULT_MAX_BATCH_SIZE: int = 1000
+
+# Minimum delay, in seconds, between two connection servicing by keep_alive()
+KEEP_ALIVE_INTERVAL: float = 5.0
+
+
+def _encode(body: Dict) -> bytes:
+    """
+    Serializes a message body to JSON bytes.
+
+    Bodies orjson rejects but `json.dumps` accepts, such as integers outside
+    the 64-bit range, fall back to the standard encoder.
+    """
+    try:
+        return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(body).encode()
+
 
 class RabbitmqPublisher(
     bindl.rabbitmq_wrapper.common.RabbitMQBase
-):  # pylint: disable=too-few-public-methods
+):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     A RabbitMQ publisher class for sending messages to a specified exchange and routing key.
     This class uses the pika library to handle the connection and message publishing.
     """
 
+    # Messages are always published as persistent; the properties are shared
+    # by every publish since pika only reads them.
+    _PERSISTENT_PROPERTIES = pika.BasicProperties(delivery_mode=2)
+
+    # Durable exchanges already declared, keyed by broker and declaration
+    # arguments, so later publishers skip the exchange_declare round-trip.
+    _declared_exchanges: ClassVar[set[tuple]] = set()
+
     def __init__(
         self,
         exchange: str,
         routing_key: Optional[str] = "",
+        confirm_window: int = 0,
         **kwargs: Optional[str],
     ) -> None:
         """
@@ -32,15 +62,27 @@ class RabbitmqPublisher(
         **Parameters:**
             exchange: The name of the RabbitMQ exchange to publish messages to.
             routing_key: The routing key for the message.
+            confirm_window: If greater than zero, enables publisher confirms and
+                allows up to this number of messages awaiting confirmation. Sending
+                only blocks while the window is full, and messages that the broker
+                nacks or returns are reported by the next call. Defaults to 0
+                (no confirms).
             host: The hostname of the RabbitMQ server. Defaults to "localhost".
             port: The port number of the RabbitMQ server. Defaults to 5672.
         """
         super().__init__(**kwargs)
         self.__exchange = exchange
         self.__routing_key = routing_key
+        self.__confirm_window = max(0, confirm_window)
+        self.__delivery_tag = 0
+        self.__unconfirmed: set[int] = set()
+        self.__failed = 0
+        self.__last_io = time.monotonic()
         self.__connection_parameters = self._get_connection_params()
         self.__connection = self.__create_connection()
         self.__channel = self.__create_channel()
+        if self.__confirm_window:
+            self.__enable_confirms()
 
     def __declare_exchange(
         self, channel, exchange_type="direct", durable=True, auto_delete=False
@@ -87,6 +129,17 @@ class RabbitmqPublisher(
             RuntimeError: If the exchange cannot be declared.
         """
         channel = self.__connection.channel()
+        key = (
+            self.__connection_parameters.host,
+            self.__connection_parameters.port,
+            self.__connection_parameters.virtual_host,
+            self.__exchange,
+            exchange_type,
+            durable,
+            auto_delete,
+        )
+        if key in RabbitmqPublisher._declared_exchanges:
+            return channel
         try:
             # Declare the exchange to ensure it exists
             self.__declare_exchange(
@@ -96,11 +149,16 @@ class RabbitmqPublisher(
             raise RuntimeError(
                 f"Failed to declare exchange '{self.__exchange}': {e}"
             ) from e
+        # Non-durable or auto-delete exchanges may disappear from the broker,
+        # so they are declared again by every publisher.
+        if durable and not auto_delete:
+            RabbitmqPublisher._declared_exchanges.add(key)
         return channel
 
     def __create_connection(self) -> pika.BlockingConnection:
         """
-        Creates a connection to RabbitMQ with error handling and retry logic.
+        Retrieves the connection to RabbitMQ shared with the other publishers
+        and consumers of the same broker.
 
         **Returns:**
             A BlockingConnection object for RabbitMQ.
@@ -109,13 +167,94 @@ class RabbitmqPublisher(
             RuntimeError: If the connection to RabbitMQ cannot be established.
         """
         try:
-            connection = pika.BlockingConnection(self.__connection_parameters)
+            connection = self.shared_connection(self.__connection_parameters)
             if not connection.is_open:
                 raise RuntimeError("Failed to establish a connection to RabbitMQ.")
             return connection
         except pika.exceptions.AMQPConnectionError as e:
             raise RuntimeError(f"Error connecting to RabbitMQ: {e}") from e
 
+    def __enable_confirms(self) -> None:
+        """
+        Puts the channel in publisher-confirms mode.
+
+        The confirmations are tracked asynchronously on the underlying channel:
+        `BlockingChannel.confirm_delivery` would wait for each message in turn.
+        """
+        # pylint: disable=protected-access
+        selected: list[bool] = []
+        self.__channel._impl.add_on_return_callback(self.__on_return)
+        self.__channel._impl.confirm_delivery(
+            ack_nack_callback=self.__on_confirm,
+            callback=lambda _frame: selected.append(True),
+        )
+        self.__channel._flush_output(lambda: bool(selected))
+
+    def __on_confirm(self, frame: pika.frame.Method) -> None:
+        """
+        Removes the messages acked or nacked by the broker from the window.
+        """
+        method = frame.method
+        pending = len(self.__unconfirmed)
+        if method.multiple:
+            self.__unconfirmed = {
+                tag for tag in self.__unconfirmed if tag > method.delivery_tag
+            }
+        else:
+            self.__unconfirmed.discard(method.delivery_tag)
+        if isinstance(method, pika.spec.Basic.Nack):
+            self.__failed += pending - len(self.__unconfirmed)
+
+    def __on_return(self, *_args) -> None:
+        """
+        Records a mandatory message returned by the broker as unroutable.
+        """
+        self.__failed += 1
+
+    def __publish(self, body: bytes, mandatory: bool) -> None:
+        """
+        Queues a message on the underlying channel without flushing the connection.
+        """
+        self.__channel._impl.basic_publish(  # pylint: disable=protected-access
+            exchange=self.__exchange,
+            routing_key=self.__routing_key,
+            body=body,
+            properties=self._PERSISTENT_PROPERTIES,
+            mandatory=mandatory,
+        )
+        if self.__confirm_window:
+            self.__delivery_tag += 1
+            self.__unconfirmed.add(self.__delivery_tag)
+
+    def __wait_for_confirms(self, max_unconfirmed: int) -> None:
+        """
+        Flushes the connection and processes confirmations until at most
+        `max_unconfirmed` messages are awaiting one.
+
+        **Raises:**
+            RuntimeError: If messages were nacked or returned by the broker.
+        """
+        self.__channel._flush_output(  # pylint: disable=protected-access
+            lambda: len(self.__unconfirmed) <= max_unconfirmed
+        )
+        if self.__failed:
+            failed, self.__failed = self.__failed, 0
+            raise RuntimeError(
+                f"{failed} message(s) were not acknowledged or could not be routed"
+            )
+
+    def wait_for_confirms(self) -> None:
+        """
+        Blocks until the broker confirmed every message sent so far.
+
+        Does nothing if the publisher was created without `confirm_window`.
+
+        **Raises:**
+            RuntimeError: If messages were nacked or returned by the broker.
+        """
+        if self.__confirm_window:
+            self.__wait_for_confirms(0)
+
     def send_message(self, body: Dict, mandatory: bool = False) -> None:
         """
         Sends a message to the specified exchange and routing key.
@@ -125,17 +264,106 @@ class RabbitmqPublisher(
             mandatory: If True, raises an exception if the message cannot be routed to a queue.
 
         **Raises:**
-            RuntimeError: If the message cannot be routed or delivered.
+            RuntimeError: If the message cannot be serialized, routed or delivered.
         """
+        self.__last_io = time.monotonic()
+        try:
+            payload = _encode(body)
+        except (TypeError, ValueError) as e:
+            raise RuntimeError(f"Message could not be serialized: {e}") from e
+        if self.__confirm_window:
+            try:
+                self.__publish(payload, mandatory)
+                self.__wait_for_confirms(self.__confirm_window - 1)
+            except pika.exceptions.AMQPError as e:
+                raise RuntimeError(f"Failed to publish message: {e}") from e
+            return
         try:
             self.__channel.basic_publish(
                 exchange=self.__exchange,
                 routing_key=self.__routing_key,
-                body=json.dumps(body),
-                properties=pika.BasicProperties(delivery_mode=2),
+                body=payload,
+                properties=self._PERSISTENT_PROPERTIES,
                 mandatory=mandatory,
             )
         except pika.exceptions.UnroutableError as e:
             raise RuntimeError(f"Message could not be routed: {e}") from e
         except pika.exceptions.NackError as e:
             raise RuntimeError(f"Message was not acknowledged: {e}") from e
+
+    def send_batch(
+        self,
+        bodies: Iterable[Dict],
+        mandatory: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Sends several messages to the specified exchange and routing key at once.
+
+        The messages are queued on the channel and written to the socket in a
+        single I/O pass per `max_batch_size` messages, instead of flushing the
+        connection after each one as `send_message()` does. Bodies are read
+        from `bodies` as they are sent, so a large generator is never buffered
+        in memory as a whole.
+
+        With `confirm_window`, the batch only blocks when the window is full.
+
+        **Parameters:**
+            bodies: The message bodies to be sent. Each one should be a dictionary.
+            mandatory: If True, unroutable messages are returned by the broker.
+            max_batch_size: Maximum number of messages queued before they are
+                written to the socket. Defaults to 1000.
+
+        **Raises:**
+            RuntimeError: If a message cannot be serialized or published, or if
+                messages were nacked or returned by the broker.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be greater than zero")
+        # BlockingChannel.basic_publish flushes the socket on every call, so
+        # the frames are queued on the underlying channel and flushed once per
+        # batch, without dispatching the callbacks of other channels of the
+        # connection.
+        self.__last_io = time.monotonic()
+        try:
+            for index, body in enumerate(bodies, start=1):
+                self.__publish(_encode(body), mandatory)
+                if self.__confirm_window and (
+                    len(self.__unconfirmed) >= self.__confirm_window
+                ):
+                    self.__wait_for_confirms(self.__confirm_window - 1)
+                elif index % max_batch_size == 0:
+                    self.__channel._flush_output()  # pylint: disable=protected-access
+            self.__wait_for_confirms(max(self.__confirm_window - 1, 0))
+        except (TypeError, ValueError) as e:
+            raise RuntimeError(f"Message could not be serialized: {e}") from e
+        except pika.exceptions.AMQPError as e:
+            raise RuntimeError(f"Failed to publish message batch: {e}") from e
+
+    def keep_alive(self) -> None:
+        """
+        Services the connection so heartbeats keep flowing while the publisher is idle.
+
+        Sending messages already services the connection. Long-lived publishers
+        that may stay idle longer than the heartbeat timeout should call this
+        periodically to avoid the broker closing the connection. It only does
+        I/O once `KEEP_ALIVE_INTERVAL` seconds passed since the last send or
+        servicing, so it is cheap to call often.
+        """
+        now = time.monotonic()
+        if now - self.__last_io < KEEP_ALIVE_INTERVAL:
+            return
+        # Run the I/O loop and its heartbeat timers once, without blocking, like
+        # send_batch() does: unlike process_data_events, this does not dispatch
+        # the deliveries of consumers sharing the connection.
+        # pylint: disable=protected-access
+        polled: list[bool] = []
+        timer = self.__connection._impl._adapter_call_later(
+            0, lambda: polled.append(True)
+        )
+        try:
+            self.__channel._flush_output(lambda: bool(polled))
+        finally:
+            if not polled:
+                self.__connection._impl._adapter_remove_timeout(timer)
+        self.__last_io = now
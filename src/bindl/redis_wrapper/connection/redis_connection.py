@@ -1,8 +1,8 @@
 """This module provides a handler for managing Redis database connections."""
 
-from typing import Optional, TypedDict
+from typing import ClassVar, Literal, Optional, TypedDict
 
-from redis import Redis
+from redis import BlockingConnectionPool, ConnectionPool, Redis
 import bindl.logger
 
 LOG = bindl.logger.setup_logger(__name__)
@@ -13,18 +13,38 @@ LOG = bindl.logger.setup_logger(__name__)
 # to allow flexibility in different environments (e.g., development, testing, production).
 # The default values are set to connect to a Redis server running on localhost at port 6379,
 # using the default database (0).
+# Connections are taken from a pool shared by every handler of the same server and
+# database. MAX_CONNECTIONS bounds the pool; it is unset by default, so the pool
+# grows with the number of concurrent commands (blocking commands such as
+# BLPOP key 0 or pub/sub listeners each hold a connection). Once bounded, the
+# "blocking" pool class makes callers wait for a free connection when the pool is
+# exhausted instead of failing. SOCKET_TIMEOUT bounds each socket operation; it is
+# unset by default, since blocking commands (BLPOP key 0, XREAD BLOCK, pub/sub)
+# would otherwise time out while idle. Set them to opt in.
+# These settings are read when the first handler of a server and database creates
+# its pool: changing them afterwards does not affect that pool.
+# With DECODE_RESPONSES enabled, replies are decoded to `str` by the client parser,
+# which redis-py picks from the hiredis C extension installed with `redis[hiredis]`.
 class RedisConnectionConfig(TypedDict):
     """Configuration for Redis connection."""
 
     HOST: str
     PORT: int
     DB: int
+    MAX_CONNECTIONS: Optional[int]
+    SOCKET_TIMEOUT: Optional[float]
+    POOL_CLASS: Literal["blocking", "default"]
+    DECODE_RESPONSES: bool
 
 
 REDIS_CONNECTION_CONFIG: RedisConnectionConfig = {
     "HOST": "localhost",
     "PORT": 6379,
     "DB": 0,
+    "MAX_CONNECTIONS": None,
+    "SOCKET_TIMEOUT": None,
+    "POOL_CLASS": "blocking",
+    "DECODE_RESPONSES": True,
 }
 
 
@@ -35,13 +55,24 @@ class RedisConnectionError(Exception):
 class RedisConnectionHandler(Redis):
     """
     Handles Redis database connections and provides methods to connect and retrieve the connection.
+
+    Connection pools are shared by every handler pointing to the same
+    (host, port, db) with the same decoding, so creating several handlers
+    does not open extra sockets. A pool is configured from
+    `REDIS_CONNECTION_CONFIG` when it is created; later changes to the
+    configuration only apply to new servers or databases.
     """
 
-    def __init__(
+    _pools: ClassVar[dict[tuple[str, int, int, bool], ConnectionPool]] = {}
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         host: Optional[str] = None,
         port: Optional[int] = None,
         db: Optional[int] = None,
+        *,
+        single_connection: bool = False,
+        decode_responses: Optional[bool] = None,
     ) -> None:
         """
         Handle Redis database connections.
@@ -50,6 +81,14 @@ class RedisConnectionHandler(Redis):
         - `host`: The hostname of the Redis server.
         - `port`: The port number of the Redis server.
         - `db`: The database number to connect to.
+        - `single_connection`: If True, the client holds a single socket and
+        serializes every command on it instead of checking out a pool connection
+        per command. The socket comes from a dedicated one-connection pool, so it
+        is not taken out of the pool shared with the other handlers. Meant for
+        single-threaded or event-loop callers; pair it with the pipelined bulk
+        operations of `RedisHandler` for throughput.
+        - `decode_responses`: If True, replies are returned as `str` instead of `bytes`.
+        Defaults to `REDIS_CONNECTION_CONFIG["DECODE_RESPONSES"]`.
         - `connection`: The Redis connection object (initialized as None).
 
         **Methods:**
@@ -57,36 +96,95 @@ class RedisConnectionHandler(Redis):
         - `get_connection()`: Retrieve the active Redis connection. Raises an exception
         if the connection is not established.
         """
+        self.__single_connection: bool = single_connection
+        self.__connection: Optional[Redis] = None
+        # The handler itself is a client of the shared pool, so it does not
+        # create a second, unbounded pool of its own. Host, port, db and
+        # decoding are only kept in the pool's connection settings.
         super().__init__(
-            host=host or REDIS_CONNECTION_CONFIG["HOST"],
-            port=port or REDIS_CONNECTION_CONFIG["PORT"],
-            db=db or REDIS_CONNECTION_CONFIG["DB"],
+            connection_pool=RedisConnectionHandler.__get_pool(
+                host or REDIS_CONNECTION_CONFIG["HOST"],
+                port or REDIS_CONNECTION_CONFIG["PORT"],
+                db or REDIS_CONNECTION_CONFIG["DB"],
+                (
+                    REDIS_CONNECTION_CONFIG["DECODE_RESPONSES"]
+                    if decode_responses is None
+                    else decode_responses
+                ),
+            )
         )
-        self.__host: str = host or REDIS_CONNECTION_CONFIG["HOST"]
-        self.__port: int = port or REDIS_CONNECTION_CONFIG["PORT"]
-        self.__db: int = db or REDIS_CONNECTION_CONFIG["DB"]
-        self.__connection: Optional[Redis] = None
 
     def connect(self) -> Redis:
         """
         Establish a connection to the Redis database.
 
+        The client is created once and returned again by later calls.
+
         **Returns:**
         - `Redis`: An instance of the Redis connection.
         """
+        if self.__connection is not None:
+            return self.__connection
         try:
+            connection_kwargs = self.connection_pool.connection_kwargs
             LOG.info(
                 "Connecting to Redis at %s:%d, DB: %d",
-                self.__host,
-                self.__port,
-                self.__db,
+                connection_kwargs["host"],
+                connection_kwargs["port"],
+                connection_kwargs["db"],
+            )
+            pool = self.connection_pool
+            if self.__single_connection:
+                # The client keeps its socket checked out for its whole life, so
+                # it gets its own pool instead of shrinking the shared one
+                pool = ConnectionPool(
+                    connection_class=pool.connection_class,
+                    max_connections=1,
+                    **pool.connection_kwargs,
+                )
+            self.__connection = Redis(
+                connection_pool=pool,
+                single_connection_client=self.__single_connection,
             )
-            self.__connection = Redis(host=self.__host, port=self.__port, db=self.__db)
             LOG.info("Connected to Redis")
             return self.__connection
         except Exception as e:
             raise RedisConnectionError(f"Failed to connect to Redis: {e}") from e
 
+    @staticmethod
+    def __get_pool(
+        host: str, port: int, db: int, decode_responses: bool
+    ) -> ConnectionPool:
+        """
+        Retrieve the connection pool shared by the handlers of this server, database
+        and decoding mode.
+
+        **Returns:**
+        - `ConnectionPool`: The pool, created on first use from `REDIS_CONNECTION_CONFIG`.
+        """
+        key = (host, port, db, decode_responses)
+        pool = RedisConnectionHandler._pools.get(key)
+        if pool is None:
+            max_connections = REDIS_CONNECTION_CONFIG["MAX_CONNECTIONS"]
+            # An unbounded pool never runs out of connections, so it is never
+            # a blocking one
+            pool_class = (
+                BlockingConnectionPool
+                if max_connections
+                and REDIS_CONNECTION_CONFIG["POOL_CLASS"] == "blocking"
+                else ConnectionPool
+            )
+            pool = pool_class(
+                host=host,
+                port=port,
+                db=db,
+                max_connections=max_connections,
+                socket_timeout=REDIS_CONNECTION_CONFIG["SOCKET_TIMEOUT"],
+                decode_responses=decode_responses,
+            )
+            RedisConnectionHandler._pools[key] = pool
+        return pool
+
     def get_connection(self) -> Redis:
         """
         Retrieve the established Redis connection.
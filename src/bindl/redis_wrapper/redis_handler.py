@@ -1,6 +1,10 @@
 """A module for handling Redis database operations, including key-value and hash operations."""
 
-from typing import Optional
+import threading
+from typing import Any, Optional
+
+# Default number of queued commands sent to Redis in a single pipeline write
+DEFAULT_BATCH_SIZE: int = 500
 
 
 class RedisHandler:
@@ -8,20 +12,31 @@ class RedisHandler:
     A handler class for interacting with a Redis database. Provides methods for
     direct key-value operations and hash operations.
 
+    Values are returned as the client decodes them, so the client is expected
+    to be created with `decode_responses=True` (the `RedisConnectionHandler` default).
+
     **Attributes:**
     - `redis`: An instance of the Redis client.
     """
 
-    def __init__(self, redis_conn) -> None:
+    def __init__(self, redis_conn, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
         """
         Initialize the RedisHandler with the specified Redis server connection details.
 
         **Request Body:**
-        - `host`: The hostname of the Redis server. Defaults to 'localhost'.
-        - `port`: The port number of the Redis server. Defaults to 6379.
-        - `db`: The database index to connect to. Defaults to 0.
+        - `redis_conn`: The Redis client used to run the commands.
+        - `batch_size`: Maximum number of commands queued before the pipeline
+        is automatically flushed. Defaults to 500.
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero")
         self.__redis_conn = redis_conn
+        self.__batch_size = batch_size
+        self.__pipeline: Any = None
+        self.__queued: int = 0
+        # Guards the pipeline shared by queue_value() and flush(), so a handler
+        # can still be used from several threads
+        self.__queue_lock = threading.RLock()
 
     # Direct key-value operations
     def set_value(self, key: str, value: str, expiration: Optional[int] = None) -> None:
@@ -33,6 +48,8 @@ class RedisHandler:
         - `value`: The value to associate with the key.
         - `expiration`: The expiration time in seconds (optional).
         If not provided, the key will not expire.
+
+        Prefer `set_many()` when setting several keys.
         """
         try:
             self.__redis_conn.set(key, value, ex=expiration)
@@ -50,25 +67,155 @@ class RedisHandler:
 
         **Returns:**
         A string containing the value associated with the key, or `None` if the key does not exist.
+
+        Prefer `get_many()` when retrieving several keys.
         """
         try:
-            value = self.__redis_conn.get(key)
-            return value.decode("utf-8") if isinstance(value, bytes) else None
+            return self.__redis_conn.get(key)
         except Exception as e:
             raise RuntimeError(f"Failed to retrieve value for key '{key}': {e}") from e
 
+    # Bulk operations
+    def set_many(
+        self, mapping: dict[str, str], expiration: Optional[int] = None
+    ) -> None:
+        """
+        Set several key-value pairs in the Redis database.
+
+        Without expiration, up to `batch_size` pairs are written with a single
+        `MSET`; larger mappings are split into one `MSET` per `batch_size` pairs,
+        sent in a single pipeline write, so the server never blocks on one huge
+        command. With expiration, one `SET` per key is sent through a
+        non-transactional pipeline, so each chunk of `batch_size` keys costs a
+        single round-trip.
+
+        **Request Body:**
+        - `mapping`: The key-value pairs to set.
+        - `expiration`: The expiration time in seconds applied to every key (optional).
+        If not provided, the keys will not expire.
+        """
+        if not mapping:
+            return
+        try:
+            if expiration is None and len(mapping) <= self.__batch_size:
+                self.__redis_conn.mset(mapping)
+                return
+            with self.__redis_conn.pipeline(transaction=False) as pipe:
+                if expiration is None:
+                    items = list(mapping.items())
+                    for start in range(0, len(items), self.__batch_size):
+                        pipe.mset(dict(items[start : start + self.__batch_size]))
+                else:
+                    for index, (key, value) in enumerate(mapping.items(), start=1):
+                        pipe.set(key, value, ex=expiration)
+                        if index % self.__batch_size == 0:
+                            pipe.execute()
+                pipe.execute()
+        except Exception as e:
+            raise RuntimeError(f"Failed to set {len(mapping)} keys: {e}") from e
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        """
+        Retrieve the values associated with several keys using `MGET`.
+
+        Up to `batch_size` keys are read with a single `MGET`. Larger key lists
+        are split into several `MGET` commands, sent in a single pipeline write,
+        so the server never blocks on one huge command.
+
+        **Request Body:**
+        - `keys`: The keys to retrieve the values for.
+
+        **Returns:**
+        A list with the value of each key, in the same order as `keys`, holding
+        `None` for the keys that do not exist.
+        """
+        if not keys:
+            return []
+        try:
+            if len(keys) <= self.__batch_size:
+                return self.__redis_conn.mget(keys)
+            with self.__redis_conn.pipeline(transaction=False) as pipe:
+                for start in range(0, len(keys), self.__batch_size):
+                    pipe.mget(keys[start : start + self.__batch_size])
+                return [value for chunk in pipe.execute() for value in chunk]
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve {len(keys)} keys: {e}") from e
+
+    def queue_value(
+        self, key: str, value: str, expiration: Optional[int] = None
+    ) -> None:
+        """
+        Queue a key-value pair to be written on the next pipeline flush.
+
+        This is a fire-and-forget alternative to `set_value()`: the command is
+        only sent when `flush()` is called or when `batch_size` commands are queued.
+
+        **Request Body:**
+        - `key`: The key to set.
+        - `value`: The value to associate with the key.
+        - `expiration`: The expiration time in seconds (optional).
+        """
+        with self.__queue_lock:
+            if self.__pipeline is None:
+                self.__pipeline = self.__redis_conn.pipeline(transaction=False)
+            self.__pipeline.set(key, value, ex=expiration)
+            self.__queued += 1
+            if self.__queued >= self.__batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Send all the commands queued by `queue_value()` in a single pipeline write.
+        """
+        with self.__queue_lock:
+            if self.__pipeline is None or not self.__queued:
+                return
+            queued, self.__queued = self.__queued, 0
+            try:
+                self.__pipeline.execute()
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to flush {queued} queued commands: {e}"
+                ) from e
+
     def delete_key(self, key: str) -> None:
         """
         Delete a key-value pair from the Redis database.
 
         **Request Body:**
         - `key`: The key to delete.
+
+        Prefer `delete_many()` when deleting several keys.
         """
         try:
             self.__redis_conn.delete(key)
         except Exception as e:
             raise RuntimeError(f"Failed to delete key '{key}': {e}") from e
 
+    def delete_many(self, keys: list[str]) -> None:
+        """
+        Delete several key-value pairs from the Redis database using `DEL`.
+
+        Up to `batch_size` keys are deleted with a single `DEL`. Larger key lists
+        are split into one `DEL` per `batch_size` keys, sent in a single pipeline
+        write, so the server never blocks on one huge command.
+
+        **Request Body:**
+        - `keys`: The keys to delete.
+        """
+        if not keys:
+            return
+        try:
+            if len(keys) <= self.__batch_size:
+                self.__redis_conn.delete(*keys)
+                return
+            with self.__redis_conn.pipeline(transaction=False) as pipe:
+                for start in range(0, len(keys), self.__batch_size):
+                    pipe.delete(*keys[start : start + self.__batch_size])
+                pipe.execute()
+        except Exception as e:
+            raise RuntimeError(f"Failed to delete {len(keys)} keys: {e}") from e
+
     # Hash operations
     def set_hash(
         self, name: str, key: str, value: str, expiration: Optional[int] = None
@@ -82,11 +229,18 @@ class RedisHandler:
         - `value`: The value to associate with the field key.
         - `expiration`: The expiration time in seconds (optional).
         If not provided, the hash will not expire.
+
+        Prefer `set_hash_many()` when setting several fields of the same hash.
         """
         try:
-            self.__redis_conn.hset(name, key, value)
-            if expiration:
-                self.__redis_conn.expire(name, expiration)
+            if not expiration:
+                self.__redis_conn.hset(name, key, value)
+                return
+            # HSET and EXPIRE are sent together in a single network write
+            with self.__redis_conn.pipeline(transaction=False) as pipe:
+                pipe.hset(name, key, value)
+                pipe.expire(name, expiration)
+                pipe.execute()
         except Exception as e:
             raise RuntimeError(
                 f"Failed to set hash '{name}' with key '{key}' and value '{value}': {e}"
@@ -103,11 +257,55 @@ class RedisHandler:
         **Returns:**
         A string containing the value associated with the field key, or `None`
         if the field does not exist.
+
+        Prefer `get_hash_all()` when retrieving several fields of the same hash.
         """
         try:
-            value = self.__redis_conn.hget(name, key)
-            return value.decode("utf-8") if isinstance(value, bytes) else None
+            return self.__redis_conn.hget(name, key)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to retrieve hash '{name}' with key '{key}': {e}"
             ) from e
+
+    def set_hash_many(
+        self, name: str, mapping: dict[str, str], expiration: Optional[int] = None
+    ) -> None:
+        """
+        Set several fields in a hash stored in the Redis database with a single `HSET`.
+
+        **Request Body:**
+        - `name`: The name of the hash.
+        - `mapping`: The field keys and values to set.
+        - `expiration`: The expiration time in seconds (optional).
+        If not provided, the hash will not expire.
+        """
+        if not mapping:
+            return
+        try:
+            if not expiration:
+                self.__redis_conn.hset(name, mapping=mapping)
+                return
+            with self.__redis_conn.pipeline(transaction=False) as pipe:
+                pipe.hset(name, mapping=mapping)
+                pipe.expire(name, expiration)
+                pipe.execute()
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to set {len(mapping)} fields in hash '{name}': {e}"
+            ) from e
+
+    def get_hash_all(self, name: str) -> dict[str, str]:
+        """
+        Retrieve every field of a hash from the Redis database with a single `HGETALL`.
+
+        **Request Body:**
+        - `name`: The name of the hash.
+
+        **Returns:**
+        A dictionary with the fields and values of the hash, empty if the hash
+        does not exist.
+        """
+        try:
+            return self.__redis_conn.hgetall(name)
+        except Exception as e:
+            raise RuntimeError(f"Failed to retrieve hash '{name}': {e}") from e
@@ -1,14 +1,18 @@
 """Load all cache data on the start form"""
 
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Optional
 
 from bindl.redis_wrapper import redis_handler  # pylint: disable=import-error
 from bindl.redis_wrapper.connection import (
     redis_connection,
 )  # pylint: disable=import-error
 
+# Number of keys requested from Redis on each SCAN iteration
+SCAN_COUNT: int = 1000
 
-class _StartForm:
+
+class _StartForm:  # pylint: disable=too-few-public-methods
     """
     A class to manage a cache of data with optional retrieval by key.
     """
@@ -17,29 +21,18 @@ class _StartForm:
         """
         Initialize the StartForm object.
         **Attributes:**
-        - `__cache_date`: An optional dictionary to store cached data.
-        It is initialized as `None` and can hold key-value pairs of any type.
+        - `__cache_date`: A dictionary with every string key-value pair stored
+        in Redis when the object is created.
         """
-        self.__cache_date: dict[str, Any] = {}
-
         redis_conn = redis_connection.RedisConnectionHandler().connect()
         redis_repo = redis_handler.RedisHandler(redis_conn)
-        keys = redis_conn.keys("*")
-
-        for key in keys:  # type: ignore
-            key = key.decode("utf-8")
-            value = redis_repo.get_value(key)
-            if value:
-                self.__cache_date[key] = value
-        self.load_cache(self.__cache_date)
-
-    def load_cache(self, data: Dict[str, Any]) -> None:
-        """
-        Load data into the cache.
-        **Parameters:**
-        - `data`: A dictionary containing key-value pairs to be loaded into the cache.
-        """
-        self.__cache_date = data
+        # SCAN walks the keyspace incrementally instead of blocking the server
+        # like KEYS does; the values are then read with batched MGETs.
+        keys: list[str] = list(redis_conn.scan_iter(count=SCAN_COUNT))
+        values = redis_repo.get_many(keys)
+        self.__cache_date: dict[str, Any] = {
+            key: value for key, value in zip(keys, values) if value
+        }
 
     def get_cache(self, key: str) -> Optional[Any]:
         """
@@ -49,10 +42,33 @@ class _StartForm:
         **Returns:**
         - The value associated with the key if it exists in the cache, otherwise `None`.
         """
+        return self.__cache_date.get(key)
+
 
-        if self.__cache_date and key in self.__cache_date:
-            return self.__cache_date[key]
-        return None
+_start_form: Optional[_StartForm] = None
+_start_form_lock = threading.Lock()
 
 
-start_form = _StartForm()
+def get_start_form() -> _StartForm:
+    """
+    Retrieve the shared start form, loading it from Redis on first use.
+
+    The cache is loaded once even if several threads ask for it at the same time.
+    **Returns:**
+    - The `_StartForm` instance shared by the process.
+    """
+    global _start_form  # pylint: disable=global-statement
+    if _start_form is None:
+        with _start_form_lock:
+            if _start_form is None:
+                _start_form = _StartForm()
+    return _start_form
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load `start_form` lazily, so importing this module does not query Redis.
+    """
+    if name == "start_form":
+        return get_start_form()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")